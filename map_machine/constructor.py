@@ -1,6 +1,7 @@
 """Construct Map Machine nodes and ways."""
 import logging
 import sys
+from copy import copy
 from datetime import datetime
 from hashlib import sha256
 from typing import Any, Iterator, Optional, Union
@@ -14,8 +15,10 @@ from map_machine.feature.crater import Crater
 from map_machine.feature.direction import DirectionSector
 from map_machine.feature.road import Road, Roads
 from map_machine.feature.tree import Tree
-from map_machine.figure import StyledFigure
+from map_machine.figure import Figure, StyledFigure
 from map_machine.geometry.flinger import Flinger
+from map_machine.geometry.quadtree import Box
+from map_machine.geometry.vector import Polyline
 from map_machine.map_configuration import DrawingMode, MapConfiguration
 from map_machine.osm.osm_reader import (
     OSMData,
@@ -532,9 +535,149 @@ class Constructor:
         )
         self.points.append(point)
 
+    def get_figure_box(self, figure: Figure) -> np.ndarray:
+        """Get bounding box of the figure on the plane."""
+        coordinates: list[np.ndarray] = [
+            node.coordinates
+            for nodes in figure.outers + figure.inners
+            for node in nodes
+        ]
+        if not coordinates:
+            return get_bounding_box(np.empty((0, 2)))
+        return get_bounding_box(self.flinger.fling_batch(np.array(coordinates)))
+
+    def get_boxes(self) -> dict[str, np.ndarray]:
+        """
+        Get bounding boxes of all constructed elements on the plane.
+
+        :return: arrays of shape (N, 4) with boxes in the form of
+            (x_min, y_min, x_max, y_max) for every list of elements
+        """
+        boxes: dict[str, list[np.ndarray]] = {
+            "figures": [self.get_figure_box(x) for x in self.figures],
+            "buildings": [self.get_figure_box(x) for x in self.buildings],
+            "roads": [
+                get_bounding_box(np.array(x.line.points))
+                for x in self.roads.roads
+            ],
+        }
+        for name in "points", "trees", "craters", "direction_sectors":
+            boxes[name] = [
+                np.concatenate((x.point, x.point)) for x in getattr(self, name)
+            ]
+        return {
+            name: np.array(value, dtype=np.float64).reshape(-1, 4)
+            for name, value in boxes.items()
+        }
+
+    def get_part(
+        self, box: Box, boxes: Optional[dict[str, np.ndarray]] = None
+    ) -> "Constructor":
+        """
+        Get constructor with only elements that intersect the box.
+
+        :param box: box on the plane in the form of (x_min, y_min, x_max,
+            y_max)
+        :param boxes: precomputed bounding boxes of elements, see `get_boxes`
+        """
+        if boxes is None:
+            boxes = self.get_boxes()
+
+        part: Constructor = Constructor(
+            self.osm_data, self.flinger, self.extractor, self.configuration
+        )
+        # Points shift their labels while drawing, so every part gets its own
+        # copies of points.
+        part.points = [
+            copy(point)
+            for point in select_intersected(self.points, boxes["points"], box)
+        ]
+        for name in (
+            "figures",
+            "trees",
+            "craters",
+            "direction_sectors",
+        ):
+            setattr(
+                part,
+                name,
+                select_intersected(getattr(self, name), boxes[name], box),
+            )
+        for building in select_intersected(
+            self.buildings, boxes["buildings"], box
+        ):
+            part.add_building(building)
+        for road in select_intersected(self.roads.roads, boxes["roads"], box):
+            # Connectors shorten road lines while drawing, so every part gets
+            # its own copy of the line.
+            road_copy: Road = copy(road)
+            road_copy.line = Polyline(list(road.line.points))
+            part.roads.append(road_copy)
+
+        return part
+
+    def get_sorted_heights(self) -> np.ndarray:
+        """
+        Get sorted array of all building heights and minimal heights.
+
+        Heights are kept as 64-bit floats, because they are compared with
+        building heights for equality.
+        """
+        return np.unique(np.fromiter(self.heights, dtype=np.float64))
+
     def get_sorted_figures(self) -> list[StyledFigure]:
-        """Get all figures sorted by priority."""
-        return sorted(self.figures)
+        """
+        Get all figures sorted by layer and then by priority.
+
+        The order is the same as defined by `StyledFigure.__lt__`, but layers
+        and priorities are computed only once per figure.
+        """
+        count: int = len(self.figures)
+        layers: np.ndarray = np.fromiter(
+            (figure.get_layer() for figure in self.figures),
+            dtype=np.float64,
+            count=count,
+        )
+        priorities: np.ndarray = np.fromiter(
+            (figure.line_style.priority for figure in self.figures),
+            dtype=np.float64,
+            count=count,
+        )
+        return [
+            self.figures[index] for index in np.lexsort((priorities, layers))
+        ]
+
+
+def get_bounding_box(points: np.ndarray) -> np.ndarray:
+    """
+    Get bounding box of points on the plane.
+
+    :param points: array of shape (N, 2)
+    :return: box in the form of (x_min, y_min, x_max, y_max); box for no points
+        doesn't intersect anything
+    """
+    if not len(points):
+        return np.array((np.inf, np.inf, -np.inf, -np.inf))
+    return np.concatenate((points.min(axis=0), points.max(axis=0)))
+
+
+def select_intersected(
+    elements: list[Any], boxes: np.ndarray, box: Box
+) -> list[Any]:
+    """
+    Get elements which bounding boxes intersect the box.
+
+    :param elements: map elements
+    :param boxes: array of shape (N, 4) with bounding boxes of the elements
+    :param box: box in the form of (x_min, y_min, x_max, y_max)
+    """
+    mask: np.ndarray = (
+        (boxes[:, 0] <= box[2])
+        & (box[0] <= boxes[:, 2])
+        & (boxes[:, 1] <= box[3])
+        & (box[1] <= boxes[:, 3])
+    )
+    return [elements[index] for index in np.flatnonzero(mask)]
 
 
 def check_level_number(tags: Tags, level: float) -> bool:
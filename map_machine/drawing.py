@@ -1,7 +1,9 @@
 """Drawing utility."""
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Optional, TextIO, Union
+from xml.etree import ElementTree
+from xml.sax.saxutils import escape
 
 import cairo
 import numpy as np
@@ -9,6 +11,7 @@ import svgwrite
 from cairo import Context, ImageSurface
 from colour import Color
 from svgwrite.base import BaseElement
+from svgwrite.container import Group
 from svgwrite.path import Path as SVGPath
 from svgwrite.shapes import Rect
 from svgwrite.text import Text
@@ -20,6 +23,15 @@ PathCommands = list[Union[float, str, np.ndarray]]
 
 DEFAULT_FONT: str = "Helvetica"
 
+# Characters that should be escaped in XML attribute values additionally to
+# `&`, `<`, and `>`.
+ATTRIBUTE_ENTITIES: dict[str, str] = {
+    '"': "&quot;",
+    "\n": "&#10;",
+    "\r": "&#13;",
+    "\t": "&#09;",
+}
+
 
 @dataclass
 class Style:
@@ -272,6 +284,124 @@ class PNGDrawing(Drawing):
         self.surface.write_to_png(str(self.file_path))
 
 
+class StreamingSVGWriter(svgwrite.Drawing):
+    """
+    SVG drawing that writes elements to the file as soon as they are added
+    instead of keeping the whole element tree in memory.
+
+    Element is serialized only when the next element is added, so it may still
+    be changed right after it was added.  Definitions are kept in memory and
+    written at the end of the document.  Elements added between `open_group`
+    and `close_group` are written inside the group.
+    """
+
+    def __init__(
+        self, output_file: TextIO, size: np.ndarray, **extra: Any
+    ) -> None:
+        """
+        :param output_file: opened text file to write SVG into
+        :param size: width and height of the image
+        :param extra: additional attributes of the `svg` element
+        """
+        self.output_file: Optional[TextIO] = None
+        self.pending: Optional[BaseElement] = None
+        self.group: Optional[Group] = None
+        self.is_group_written: bool = False
+
+        super().__init__(size=size, **extra)
+
+        # Write XML declaration and opening `svg` tag with empty definitions.
+        output_file.write('<?xml version="1.0" encoding="utf-8" ?>\n')
+        output_file.write(self.tostring()[: -len("</svg>")])
+        self.output_file = output_file
+
+    def add(self, element: BaseElement) -> BaseElement:
+        """Write previously added element and remember the new one."""
+        if self.output_file is None:
+            return super().add(element)
+
+        self.flush()
+        self.pending = element
+        return element
+
+    def write(
+        self, fileobj: TextIO, pretty: bool = False, indent: int = 2
+    ) -> None:
+        """
+        Elements are not kept in memory, so the drawing cannot be written again
+        into another file.  Use `close` to finish the output file.
+        """
+        raise NotImplementedError("streaming SVG writer, use `close`")
+
+    def _write_text(self, text: str) -> None:
+        """Write serialized element, open current group if it is not open."""
+        if self.group is not None and not self.is_group_written:
+            header: str = ElementTree.tostring(
+                self.group.get_xml(),
+                encoding="unicode",
+                short_empty_elements=False,
+            )
+            self.output_file.write(header[: -len("</g>")])
+            self.is_group_written = True
+        self.output_file.write(text)
+
+    def flush(self) -> None:
+        """Write pending element to the file."""
+        if self.pending is not None:
+            self._write_text(self.pending.tostring())
+            self.pending = None
+
+    def open_group(self, group: Group) -> None:
+        """
+        Write all next elements into the group.  Opening tag is written only
+        with the first element, so empty groups are omitted.
+
+        :param group: empty group with attributes
+        """
+        self.close_group()
+        self.group = group
+        self.is_group_written = False
+
+    def close_group(self) -> None:
+        """Finish current group."""
+        self.flush()
+        if self.is_group_written:
+            self.output_file.write("</g>")
+        self.group = None
+        self.is_group_written = False
+
+    def write_path(
+        self, path_commands: str, style: dict[str, Union[int, float, str]]
+    ) -> None:
+        """
+        Write SVG path directly without creating an element.
+
+        :param path_commands: SVG path commands
+        :param style: path attributes
+        """
+        self.flush()
+
+        # Attribute names are converted the same way `svgwrite` does it:
+        # `stroke_width` becomes `stroke-width`.
+        attributes: dict[str, Any] = {"d": path_commands}
+        for name, value in style.items():
+            attributes[name.rstrip("_").replace("_", "-")] = value
+
+        text: str = "<path"
+        for name, value in sorted(attributes.items()):
+            if value is None or not str(value):
+                continue
+            text += f' {name}="{escape(str(value), ATTRIBUTE_ENTITIES)}"'
+        self._write_text(text + " />")
+
+    def close(self) -> None:
+        """Write all remaining elements and finish the document."""
+        self.close_group()
+        if self.defs.elements:
+            self.output_file.write(self.defs.tostring())
+        self.output_file.write("</svg>")
+
+
 def parse_path(path: str) -> PathCommands:
     """Parse path command from text representation into list."""
     parts: list[str] = path.split(" ")
@@ -310,7 +440,7 @@ def draw_text(
     opacity: float = 1.0,
 ):
     """Add text element to the canvas."""
-    text_element = svg.text(
+    text_element: Text = Text(
         text,
         point,
         font_size=size,
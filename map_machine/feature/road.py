@@ -380,7 +380,11 @@ class Road(Tagged):
         self.matcher: RoadMatcher = matcher
 
         self.line: Polyline = Polyline(
-            [flinger.fling(node.coordinates) for node in self.nodes]
+            list(
+                flinger.fling_batch(
+                    np.array([node.coordinates for node in self.nodes])
+                )
+            )
         )
         self.width: Optional[float] = matcher.default_width
         self.lanes: list[Lane] = []
@@ -468,9 +472,19 @@ class Road(Tagged):
                     logging.error(f"Unknown placement `{place}`.")
 
     def get_style(
-        self, is_border: bool, is_for_stroke: bool = False
+        self,
+        is_border: bool,
+        is_for_stroke: bool = False,
+        color: Optional[Color] = None,
     ) -> dict[str, Union[int, float, str]]:
-        """Get road SVG style."""
+        """
+        Get road SVG style.
+
+        :param is_border: whether to get style for road border or road fill
+        :param is_for_stroke: whether to get style for road stroke
+        :param color: precomputed border or fill color, see `get_border_color`
+            and `get_color`
+        """
         width: float
         if self.width is not None:
             width = self.width
@@ -479,10 +493,12 @@ class Road(Tagged):
 
         border_width: float
         if is_border:
-            color = self.get_border_color()
+            if color is None:
+                color = self.get_border_color()
             border_width = 2.0
         else:
-            color = self.get_color()
+            if color is None:
+                color = self.get_color()
             border_width = 0.0
 
         extra_width: float = 0.0
@@ -527,12 +543,32 @@ class Road(Tagged):
 
         return None
 
-    def draw(self, svg: Drawing, is_border: bool) -> None:
-        """Draw road as simple SVG path."""
+    def get_path(self) -> str:
+        """Get SVG path commands for the road line with placement offset."""
+        return self.line.get_path(self.placement_offset)
+
+    def draw(
+        self,
+        svg: Drawing,
+        is_border: bool,
+        path_commands: Optional[str] = None,
+        color: Optional[Color] = None,
+    ) -> None:
+        """
+        Draw road as simple SVG path.
+
+        :param svg: output SVG file
+        :param is_border: whether to draw road border or road fill
+        :param path_commands: precomputed path commands, see `get_path`
+        :param color: precomputed border or fill color
+        """
         filter_: Filter = self.get_filter(svg, is_border)
 
-        style: dict[str, Union[int, float, str]] = self.get_style(is_border)
-        path_commands: str = self.line.get_path(self.placement_offset)
+        style: dict[str, Union[int, float, str]] = self.get_style(
+            is_border, color=color
+        )
+        if path_commands is None:
+            path_commands = self.get_path()
         path: Path
         if filter_:
             path = Path(d=path_commands, filter=filter_.get_funciri())
@@ -829,13 +865,10 @@ class Roads:
         if not self.roads:
             return
 
-        layered_roads: dict[float, list[Road]] = defaultdict(list)
         layered_connectors: dict[float, list[Connector]] = defaultdict(list)
 
         for road in self.roads:
-            if not road.is_transition:
-                layered_roads[road.layer].append(road)
-            else:
+            if road.is_transition:
                 connections = []
                 for end in 0, -1:
                     connections.append(
@@ -878,16 +911,38 @@ class Roads:
             layered_connectors[connector.min_layer].append(connector)
             layered_connectors[connector.max_layer].append(connector)
 
-        for layer in sorted(layered_roads.keys()):
-            roads: list[Road] = sorted(
-                layered_roads[layer], key=lambda x: x.matcher.priority
-            )
+        # Sort roads by layer and then by priority, and split them into layers.
+
+        roads: list[Road] = [x for x in self.roads if not x.is_transition]
+        layers: np.ndarray = np.fromiter(
+            (road.layer for road in roads), dtype=np.float64, count=len(roads)
+        )
+        priorities: np.ndarray = np.fromiter(
+            (road.matcher.priority for road in roads),
+            dtype=np.float64,
+            count=len(roads),
+        )
+        order: np.ndarray = np.lexsort((priorities, layers))
+        sorted_roads: list[Road] = [roads[index] for index in order]
+        layer_values, starts = np.unique(layers[order], return_index=True)
+        ends: np.ndarray = np.append(starts[1:], len(sorted_roads))
+
+        for layer, start, end in zip(layer_values, starts, ends):
+            roads = sorted_roads[start:end]
             connectors: list[Connector] = layered_connectors.get(layer)
 
+            # Path commands are computed once and used for both border and
+            # inner part.  Colors are also collected before drawing passes.
+            paths: list[str] = [road.get_path() for road in roads]
+            border_colors: list[Color] = [
+                road.get_border_color() for road in roads
+            ]
+            colors: list[Color] = [road.get_color() for road in roads]
+
             # Draw borders.
 
-            for road in roads:
-                road.draw(svg, True)
+            for road, path_commands, color in zip(roads, paths, border_colors):
+                road.draw(svg, True, path_commands, color)
             if connectors:
                 for connector in connectors:
                     if connector.min_layer == layer:
@@ -895,8 +950,8 @@ class Roads:
 
             # Draw inner parts.
 
-            for road in roads:
-                road.draw(svg, False)
+            for road, path_commands, color in zip(roads, paths, colors):
+                road.draw(svg, False, path_commands, color)
             if connectors:
                 for connector in connectors:
                     if connector.max_layer == layer:
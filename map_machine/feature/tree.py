@@ -7,6 +7,7 @@ circles.
 import numpy as np
 from colour import Color
 from svgwrite import Drawing
+from svgwrite.shapes import Circle
 
 from map_machine.geometry.flinger import Flinger
 from map_machine.osm.osm_reader import Tagged
@@ -34,11 +35,11 @@ class Tree(Tagged):
             radius = 2.0
 
         color: Color = scheme.get_color("evergreen_color")
-        svg.add(svg.circle(self.point, radius * scale, fill=color, opacity=0.3))
+        svg.add(Circle(self.point, radius * scale, fill=color, opacity=0.3))
 
         if (circumference := self.get_float("circumference")) is not None:
             radius: float = circumference / 2.0 / np.pi
-            circle = svg.circle(
+            circle: Circle = Circle(
                 self.point, radius * scale, fill=scheme.get_color("trunk_color")
             )
             svg.add(circle)
@@ -50,6 +50,17 @@ class Figure(Tagged):
 
         return path
 
+    def get_rings(self, flinger: Flinger) -> list[np.ndarray]:
+        """
+        Get points of outer and then inner polygons on the plane.
+
+        :param flinger: converter for geo coordinates
+        """
+        return [
+            flinger.fling_batch(np.array([node.coordinates for node in nodes]))
+            for nodes in self.outers + self.inners
+        ]
+
 
 class StyledFigure(Figure):
     """Figure with stroke and fill style."""
@@ -145,6 +156,21 @@ def make_counter_clockwise(polygon: list[OSMNode]) -> list[OSMNode]:
     return polygon if not is_clockwise(polygon) else list(reversed(polygon))
 
 
+def get_rings_path(
+    rings: list[np.ndarray], parallel_offset: float = 0.0
+) -> str:
+    """
+    Construct SVG path commands from polygons on the plane.
+
+    :param rings: points of polygons, see `Figure.get_rings`
+    :param parallel_offset: offset of the path from the polygon lines
+    """
+    return "".join(
+        f"{Polyline(list(points)).get_path(parallel_offset)} "
+        for points in rings
+    )
+
+
 def get_path(
     nodes: list[OSMNode],
     shift: np.ndarray,
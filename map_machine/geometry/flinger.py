@@ -53,6 +53,10 @@ class Flinger:
         """Do nothing but return coordinates unchanged."""
         return coordinates
 
+    def fling_batch(self, coordinates: np.ndarray) -> np.ndarray:
+        """Do nothing but return coordinates unchanged."""
+        return coordinates
+
     def get_scale(self, coordinates: Optional[np.ndarray] = None) -> float:
         return 1.0
 
@@ -104,6 +108,29 @@ class MercatorFlinger(Flinger):
 
         return result
 
+    def fling_batch(self, coordinates: np.ndarray) -> np.ndarray:
+        """
+        Convert array of geo coordinates into (x, y) position points.
+
+        :param coordinates: array of shape (N, 2) with geographical coordinates
+            in the form of (latitude, longitude)
+        :return: array of shape (N, 2) with points on the plane
+        """
+        latitudes: np.ndarray = coordinates[:, 0]
+        y: np.ndarray = (
+            180.0
+            / np.pi
+            * np.log(np.tan(np.pi / 4.0 + latitudes * np.pi / 360.0))
+        )
+        result: np.ndarray = (
+            self.ratio * np.column_stack((coordinates[:, 1], y)) - self.min_
+        )
+
+        # Invert y axis on coordinate plane.
+        result[:, 1] = self.size[1] - result[:, 1]
+
+        return result
+
     def get_scale(self, coordinates: Optional[np.ndarray] = None) -> float:
         """
         Return pixels per meter ratio for the given geo coordinates.
@@ -129,3 +156,6 @@ class TranslateFlinger(Flinger):
 
     def fling(self, coordinates: np.ndarray) -> np.ndarray:
         return self.scale * (coordinates + self.offset)
+
+    def fling_batch(self, coordinates: np.ndarray) -> np.ndarray:
+        return self.fling(coordinates)
@@ -0,0 +1,143 @@
+"""Point-region quadtree for axis-aligned boxes."""
+from typing import Any, Iterator, Optional
+
+__author__ = "Sergey Vartanov"
+__email__ = "me@enzet.ru"
+
+# Closed axis-aligned box in the form of (x_min, y_min, x_max, y_max).
+Box = tuple[float, float, float, float]
+
+
+def intersects(box_1: Box, box_2: Box) -> bool:
+    """Check whether two closed boxes have at least one common point."""
+    return (
+        box_1[0] <= box_2[2]
+        and box_2[0] <= box_1[2]
+        and box_1[1] <= box_2[3]
+        and box_2[1] <= box_1[3]
+    )
+
+
+class PRQuadtree:
+    """
+    Point-region quadtree that stores axis-aligned boxes.
+
+    Every node splits its region into four equal quadrants.  A box is stored in
+    the deepest node which quadrant fully contains it, so boxes that cross
+    quadrant borders stay in upper nodes.
+    """
+
+    def __init__(
+        self,
+        bounds: Box,
+        capacity: int = 16,
+        max_depth: int = 8,
+        depth: int = 0,
+    ) -> None:
+        """
+        :param bounds: region covered by the tree
+        :param capacity: maximum number of boxes in the leaf before it is split
+        :param max_depth: maximum depth of the tree, deepest leaves are never
+            split
+        :param depth: depth of this node inside the tree
+        """
+        self.bounds: Box = bounds
+        self.capacity: int = capacity
+        self.max_depth: int = max_depth
+        self.depth: int = depth
+
+        self.center: tuple[float, float] = (
+            (bounds[0] + bounds[2]) / 2.0,
+            (bounds[1] + bounds[3]) / 2.0,
+        )
+        self.items: list[tuple[Box, Any]] = []
+        self.children: Optional[list["PRQuadtree"]] = None
+
+    def get_child(self, box: Box) -> Optional["PRQuadtree"]:
+        """Get child node which quadrant fully contains the box."""
+        if not (
+            self.bounds[0] <= box[0]
+            and box[2] <= self.bounds[2]
+            and self.bounds[1] <= box[1]
+            and box[3] <= self.bounds[3]
+        ):
+            return None
+
+        index: int
+        if box[2] < self.center[0]:
+            index = 0
+        elif box[0] >= self.center[0]:
+            index = 1
+        else:
+            return None
+
+        if box[3] < self.center[1]:
+            pass
+        elif box[1] >= self.center[1]:
+            index += 2
+        else:
+            return None
+
+        return self.children[index]
+
+    def split(self) -> None:
+        """Create four child nodes and move boxes down where possible."""
+        x_min, y_min, x_max, y_max = self.bounds
+        x_center, y_center = self.center
+        self.children = [
+            PRQuadtree(bounds, self.capacity, self.max_depth, self.depth + 1)
+            for bounds in (
+                (x_min, y_min, x_center, y_center),
+                (x_center, y_min, x_max, y_center),
+                (x_min, y_center, x_center, y_max),
+                (x_center, y_center, x_max, y_max),
+            )
+        ]
+        items: list[tuple[Box, Any]] = self.items
+        self.items = []
+        for box, payload in items:
+            self.insert(box, payload)
+
+    def insert(self, box: Box, payload: Any = None) -> None:
+        """
+        Add box to the tree.
+
+        :param box: closed box in the form of (x_min, y_min, x_max, y_max)
+        :param payload: any object associated with the box
+        """
+        node: PRQuadtree = self
+        while node.children is not None:
+            child: Optional[PRQuadtree] = node.get_child(box)
+            if child is None:
+                break
+            node = child
+
+        node.items.append((box, payload))
+
+        if (
+            node.children is None
+            and len(node.items) > node.capacity
+            and node.depth < node.max_depth
+        ):
+            node.split()
+
+    def query(self, box: Box) -> Iterator[Any]:
+        """Iterate over payloads of all stored boxes that intersect the box."""
+        nodes: list[PRQuadtree] = [self]
+        while nodes:
+            node: PRQuadtree = nodes.pop()
+            for item_box, payload in node.items:
+                if intersects(box, item_box):
+                    yield payload
+            if node.children is not None:
+                nodes += [
+                    child
+                    for child in node.children
+                    if intersects(box, child.bounds)
+                ]
+
+    def has_intersection(self, box: Box) -> bool:
+        """Check whether any stored box intersects the box."""
+        for _ in self.query(box):
+            return True
+        return False
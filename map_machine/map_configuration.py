@@ -63,6 +63,7 @@ class MapConfiguration:
     show_overlapped: bool = False
     credit: Optional[str] = "© OpenStreetMap contributors"
     show_credit: bool = True
+    processes: int = 1
 
     @classmethod
     def from_options(
@@ -85,6 +86,7 @@ class MapConfiguration:
             options.building_colors,
             options.show_overlapped,
             show_credit=not options.hide_credit,
+            processes=options.processes,
         )
 
     def is_wireframe(self) -> bool:
@@ -2,8 +2,11 @@
 import argparse
 import logging
 import sys
+from collections import defaultdict
+from dataclasses import replace
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import Iterator, Optional, Union
 
 import numpy as np
 import svgwrite
@@ -14,10 +17,10 @@ from svgwrite.shapes import Rect
 
 from map_machine import __project__
 from map_machine.constructor import Constructor
-from map_machine.drawing import draw_text
+from map_machine.drawing import StreamingSVGWriter, draw_text
 from map_machine.feature.building import Building, draw_walls, BUILDING_SCALE
 from map_machine.feature.road import Intersection, Road, RoadPart
-from map_machine.figure import StyledFigure
+from map_machine.figure import StyledFigure, get_rings_path
 from map_machine.geometry.boundary_box import BoundaryBox
 from map_machine.geometry.flinger import Flinger, MercatorFlinger
 from map_machine.geometry.vector import Segment
@@ -36,6 +39,15 @@ __email__ = "me@enzet.ru"
 ROAD_PRIORITY: float = 40.0
 DEFAULT_SIZE: tuple[float, float] = (800.0, 600.0)
 
+# Target for elements of one drawing pass, see `Map.open_group`.
+Container = Union[Group, StreamingSVGWriter]
+
+# Minimal number of figures to compute path commands in worker processes.
+# Starting the pool takes about 10 ms and sending points of a figure takes
+# about a quarter of the time needed to construct its path commands.
+PARALLEL_FIGURES_MINIMUM: int = 5000
+PARALLEL_CHUNK_SIZE: int = 64
+
 
 class Map:
     """Map drawing."""
@@ -63,46 +75,42 @@ class Map:
         logging.info("Drawing ways...")
 
         figures: list[StyledFigure] = constructor.get_sorted_figures()
+        figure_paths: list[tuple[StyledFigure, str]] = list(
+            zip(figures, self.get_figure_paths(figures))
+        )
 
-        top_figures: list[StyledFigure] = [
-            x for x in figures if x.line_style.priority >= ROAD_PRIORITY
+        top_figures: list[tuple[StyledFigure, str]] = [
+            x for x in figure_paths if x[0].line_style.priority >= ROAD_PRIORITY
         ]
-        bottom_figures: list[StyledFigure] = [
-            x for x in figures if x.line_style.priority < ROAD_PRIORITY
+        bottom_figures: list[tuple[StyledFigure, str]] = [
+            x for x in figure_paths if x[0].line_style.priority < ROAD_PRIORITY
         ]
 
-        for figure in bottom_figures:
-            path_commands: str = figure.get_path(self.flinger)
-            if path_commands:
-                path: SVGPath = SVGPath(d=path_commands)
-                path.update(figure.line_style.style)
-                self.svg.add(path)
-
-        constructor.roads.draw(self.svg, self.flinger)
+        # Bound method used inside loops is stored in a local variable to avoid
+        # repeated lookups for every figure.
+        add_path = self.add_path
+        is_wireframe: bool = self.configuration.is_wireframe()
 
-        for figure in top_figures:
-            path_commands: str = figure.get_path(self.flinger)
+        ways: Container = self.open_group("ways")
+        for figure, path_commands in bottom_figures:
             if path_commands:
-                path: SVGPath = SVGPath(d=path_commands)
-                path.update(figure.line_style.style)
-                self.svg.add(path)
+                add_path(ways, path_commands, figure.line_style.style)
+        self.close_group(ways)
 
-        if self.scheme.draw_trees:
-            for tree in constructor.trees:
-                tree.draw(self.svg, self.flinger, self.scheme)
+        # In special drawing modes ways are drawn as figures only, so roads,
+        # buildings, trees, craters, and direction sectors are skipped.
 
-        if self.scheme.draw_craters:
-            for crater in constructor.craters:
-                crater.draw(self.svg, self.flinger)
+        if not is_wireframe:
+            constructor.roads.draw(self.svg, self.flinger)
 
-        if self.scheme.draw_buildings:
-            self.draw_buildings(
-                constructor, self.configuration.use_building_colors
-            )
+        top_ways: Container = self.open_group("top-ways")
+        for figure, path_commands in top_figures:
+            if path_commands:
+                add_path(top_ways, path_commands, figure.line_style.style)
+        self.close_group(top_ways)
 
-        if self.scheme.draw_directions:
-            for direction_sector in constructor.direction_sectors:
-                direction_sector.draw(self.svg, self.scheme)
+        if not is_wireframe:
+            self.draw_features(constructor)
 
         # All other points
 
@@ -117,30 +125,234 @@ class Map:
                     self.configuration.overlap,
                 )
 
-            nodes: list[Point] = sorted(
-                constructor.points, key=lambda x: -x.priority
+            priorities: np.ndarray = np.fromiter(
+                (point.priority for point in constructor.points),
+                dtype=np.float64,
+                count=len(constructor.points),
             )
-            logging.info("Drawing main icons...")
-            for node in nodes:
-                node.draw_main_shapes(self.svg, occupied)
-
-            logging.info("Drawing extra icons...")
-            for point in nodes:
-                point.draw_extra_shapes(self.svg, occupied)
-
-            logging.info("Drawing texts...")
-            for point in nodes:
-                if (
-                    not self.configuration.is_wireframe()
-                    and self.configuration.label_mode != LabelMode.NO
-                ):
-                    point.draw_texts(
-                        self.svg, occupied, self.configuration.label_mode
-                    )
+            nodes: list[Point] = [
+                constructor.points[index]
+                for index in np.argsort(-priorities, kind="stable")
+            ]
+            label_mode: LabelMode = self.configuration.label_mode
+            draw_labels: bool = not is_wireframe and label_mode != LabelMode.NO
+
+            main_icons: Container
+            extra_icons: Container
+            texts: Container
+
+            if occupied is None and not isinstance(
+                self.svg, StreamingSVGWriter
+            ):
+                # Without overlap checking points don't affect each other, so
+                # all shapes of a point are drawn in one pass.  Groups keep all
+                # main icons below extra icons and all icons below texts.
+                # Streaming writer can't write into three groups at once and
+                # draws points in three passes in order not to keep all
+                # elements in memory.
+                logging.info("Drawing icons and texts...")
+                main_icons = self.open_group("main-icons")
+                extra_icons = self.open_group("extra-icons")
+                texts = self.open_group("texts")
+                for node in nodes:
+                    node.draw_main_shapes(main_icons)
+                    node.draw_extra_shapes(extra_icons)
+                    if draw_labels:
+                        node.draw_texts(texts, None, label_mode)
+                for container in main_icons, extra_icons, texts:
+                    self.close_group(container)
+            else:
+                # Main icons of all points should occupy place before extra
+                # icons and texts, so points are drawn in three passes.
+                logging.info("Drawing main icons...")
+                main_icons = self.open_group("main-icons")
+                for node in nodes:
+                    node.draw_main_shapes(main_icons, occupied)
+                self.close_group(main_icons)
+
+                logging.info("Drawing extra icons...")
+                extra_icons = self.open_group("extra-icons")
+                for point in nodes:
+                    point.draw_extra_shapes(extra_icons, occupied)
+                self.close_group(extra_icons)
+
+                logging.info("Drawing texts...")
+                if draw_labels:
+                    texts = self.open_group("texts")
+                    for point in nodes:
+                        point.draw_texts(texts, occupied, label_mode)
+                    self.close_group(texts)
 
         if self.configuration.show_credit:
             self.draw_credits(constructor.flinger.size)
 
+    def draw_features(self, constructor: Constructor) -> None:
+        """Draw trees, craters, buildings, and direction sectors."""
+        svg: svgwrite.Drawing = self.svg
+        flinger: Flinger = self.flinger
+        scheme: Scheme = self.scheme
+
+        if scheme.draw_trees:
+            trees: Container = self.open_group("trees")
+            for tree in constructor.trees:
+                tree.draw(trees, flinger, scheme)
+            self.close_group(trees)
+
+        if scheme.draw_craters:
+            for crater in constructor.craters:
+                crater.draw(svg, flinger)
+
+        if scheme.draw_buildings:
+            self.draw_buildings(
+                constructor, self.configuration.use_building_colors
+            )
+
+        if scheme.draw_directions:
+            for direction_sector in constructor.direction_sectors:
+                direction_sector.draw(svg, scheme)
+
+    def open_group(self, group_id: str) -> Container:
+        """
+        Get container for elements of one drawing pass.
+
+        Elements are collected into the group that is added to the drawing at
+        once in `close_group`.  Streaming writer writes elements into the group
+        directly.
+
+        :param group_id: identifier of the SVG group
+        """
+        group: Group = Group(id=group_id)
+        if isinstance(self.svg, StreamingSVGWriter):
+            self.svg.open_group(group)
+            return self.svg
+        return group
+
+    def close_group(self, container: Container) -> None:
+        """Add group to the drawing if it is not empty."""
+        if isinstance(container, StreamingSVGWriter):
+            container.close_group()
+        elif container.elements:
+            self.svg.add(container)
+
+    def add_path(
+        self,
+        container: Container,
+        path_commands: str,
+        style: dict[str, Union[int, float, str]],
+    ) -> None:
+        """
+        Add SVG path to the group.
+
+        Streaming writer formats the path directly without creating an
+        element.
+        """
+        if isinstance(container, StreamingSVGWriter):
+            container.write_path(path_commands, style)
+        else:
+            path: SVGPath = SVGPath(d=path_commands)
+            path.update(style)
+            container.add(path)
+
+    def draw_tiled(
+        self,
+        constructor: Constructor,
+        output_path: Path,
+        tiles: tuple[int, int] = (4, 4),
+        overlap: float = 64.0,
+    ) -> list[Path]:
+        """
+        Draw map as a grid of separate SVG files.
+
+        Every tile is drawn only with elements which bounding boxes intersect
+        the tile extended by the overlap, so every drawing holds only a part of
+        the map.  Tile files are named `<name>_<x>_<y>.svg` after the output
+        path.
+
+        :param constructor: constructed map elements
+        :param output_path: path to the SVG file of the whole map
+        :param tiles: number of tiles by x and by y
+        :param overlap: width of the area around the tile in pixels; elements
+            from this area are drawn as well, so that shapes crossing tile
+            borders are not cut
+        :return: paths to tile SVG files
+        """
+        boxes: dict[str, np.ndarray] = constructor.get_boxes()
+
+        # Credits are drawn in the corner of every tile instead of the corner of
+        # the whole map.
+        configuration: MapConfiguration = replace(
+            self.configuration, show_credit=False
+        )
+        width: float = self.flinger.size[0] / tiles[0]
+        height: float = self.flinger.size[1] / tiles[1]
+        paths: list[Path] = []
+
+        for x in range(tiles[0]):
+            for y in range(tiles[1]):
+                left: float = x * width
+                top: float = y * height
+                part: Constructor = constructor.get_part(
+                    (
+                        left - overlap,
+                        top - overlap,
+                        left + width + overlap,
+                        top + height + overlap,
+                    ),
+                    boxes,
+                )
+                path: Path = output_path.with_name(
+                    f"{output_path.stem}_{x}_{y}.svg"
+                )
+                with path.open("w", encoding="utf-8") as output_file:
+                    svg: StreamingSVGWriter = StreamingSVGWriter(
+                        output_file,
+                        np.array((width, height)),
+                        viewBox=f"{left} {top} {width} {height}",
+                    )
+                    tile_map: Map = Map(self.flinger, svg, configuration)
+                    tile_map.draw(part)
+                    if self.configuration.show_credit:
+                        tile_map.draw_credits(
+                            np.array((left + width, top + height))
+                        )
+                    svg.close()
+
+                logging.info(f"Tile is drawn to {path}.")
+                paths.append(path)
+
+        return paths
+
+    def get_figure_paths(self, figures: list[StyledFigure]) -> list[str]:
+        """
+        Get SVG path commands for figures.
+
+        Path construction is independent for every figure, so for big maps it
+        may be done in worker processes, see `MapConfiguration.processes`.  SVG
+        elements are still created and added to the drawing in the main
+        process.
+        """
+        # Points are projected in the main process, so only arrays of points
+        # are sent to worker processes.
+        rings: list[list[np.ndarray]] = [
+            figure.get_rings(self.flinger) for figure in figures
+        ]
+        offsets: list[float] = [
+            figure.line_style.parallel_offset for figure in figures
+        ]
+        processes: int = self.configuration.processes
+        if processes <= 1 or len(figures) < PARALLEL_FIGURES_MINIMUM:
+            return list(map(get_rings_path, rings, offsets))
+
+        with ProcessPoolExecutor(processes) as executor:
+            return list(
+                executor.map(
+                    get_rings_path,
+                    rings,
+                    offsets,
+                    chunksize=PARALLEL_CHUNK_SIZE,
+                )
+            )
+
     def draw_buildings(
         self, constructor: Constructor, use_building_colors: bool
     ) -> None:
@@ -167,20 +379,34 @@ class Map:
                 walls[part] = building
 
         sorted_walls = sorted(walls.keys())
+        heights: np.ndarray = constructor.get_sorted_heights()
+
+        # Bucket walls by the heights at which they should be drawn: building
+        # wall is drawn for every height in `(min_height, height]`.
+        walls_by_height: dict[float, list[Segment]] = defaultdict(list)
+        for wall in sorted_walls:
+            building: Building = walls[wall]
+            start: int = np.searchsorted(
+                heights, building.min_height, side="right"
+            )
+            end: int = np.searchsorted(heights, building.height, side="right")
+            for height in heights[start:end]:
+                walls_by_height[height].append(wall)
+
+        roofs_by_height: dict[float, list[Building]] = defaultdict(list)
+        for building in constructor.buildings:
+            roofs_by_height[building.height].append(building)
 
         previous_height: float = 0.0
-        for height in sorted(constructor.heights):
+        for height in heights:
             shift_1: np.ndarray = np.array(
                 (0.0, -previous_height * scale * BUILDING_SCALE)
             )
             shift_2: np.ndarray = np.array(
                 (0.0, -height * scale * BUILDING_SCALE)
             )
-            for wall in sorted_walls:
+            for wall in walls_by_height[height]:
                 building: Building = walls[wall]
-                if building.height < height or building.min_height >= height:
-                    continue
-
                 draw_walls(
                     self.svg,
                     building,
@@ -192,33 +418,42 @@ class Map:
                 )
 
             if self.configuration.draw_roofs:
-                for building in constructor.buildings:
-                    if building.height == height:
-                        building.draw_roof(
-                            self.svg, self.flinger, scale, use_building_colors
-                        )
+                for building in roofs_by_height[height]:
+                    building.draw_roof(
+                        self.svg, self.flinger, scale, use_building_colors
+                    )
 
             previous_height = height
 
     def draw_simple_roads(self, roads: Iterator[Road]) -> None:
-        """Draw road as simple SVG path."""
-        nodes: dict[OSMNode, set[RoadPart]] = {}
-
-        for road in roads:
-            for index in range(len(road.nodes) - 1):
-                node_1: OSMNode = road.nodes[index]
-                node_2: OSMNode = road.nodes[index + 1]
-                point_1: np.ndarray = self.flinger.fling(node_1.coordinates)
-                point_2: np.ndarray = self.flinger.fling(node_2.coordinates)
+        """
+        Draw road intersections with road parts.
+
+        Experimental, not used in map drawing: roads are drawn by `Roads.draw`.
+        """
+        nodes: dict[OSMNode, set[RoadPart]] = defaultdict(set)
+        road_list: list[Road] = list(roads)
+
+        # Project every node once, even if it is shared by several roads.
+        node_indices: dict[OSMNode, int] = {}
+        for road in road_list:
+            for node in road.nodes:
+                node_indices.setdefault(node, len(node_indices))
+
+        coordinates: np.ndarray = np.array(
+            [node.coordinates for node in node_indices]
+        ).reshape(-1, 2)
+        points: np.ndarray = self.flinger.fling_batch(coordinates)
+
+        for road in road_list:
+            for node_1, node_2 in zip(road.nodes, road.nodes[1:]):
+                point_1: np.ndarray = points[node_indices[node_1]]
+                point_2: np.ndarray = points[node_indices[node_2]]
                 scale: float = self.flinger.get_scale(node_1.coordinates)
                 part_1: RoadPart = RoadPart(point_1, point_2, road.lanes, scale)
                 part_2: RoadPart = RoadPart(point_2, point_1, road.lanes, scale)
                 # part_1.draw_normal(self.svg)
 
-                for node in node_1, node_2:
-                    if node not in nodes:
-                        nodes[node] = set()
-
                 nodes[node_1].add(part_1)
                 nodes[node_2].add(part_2)
 
@@ -234,6 +469,8 @@ class Map:
         OpenStreetMap requires to use the credit “© OpenStreetMap contributors”.
 
         See https://www.openstreetmap.org/copyright
+
+        :param size: position of the bottom right corner of the image
         """
         right_margin: float = 15.0
         bottom_margin: float = 15.0
@@ -378,7 +615,6 @@ def render_map(arguments: argparse.Namespace) -> None:
     )
     size: np.ndarray = flinger.size
 
-    svg: svgwrite.Drawing = svgwrite.Drawing(arguments.output_file_name, size)
     icon_extractor: ShapeExtractor = ShapeExtractor(
         workspace.ICONS_PATH, workspace.ICONS_CONFIG_PATH
     )
@@ -391,9 +627,22 @@ def render_map(arguments: argparse.Namespace) -> None:
     )
     constructor.construct()
 
-    map_: Map = Map(flinger=flinger, svg=svg, configuration=configuration)
-    map_.draw(constructor)
-
+    # Elements are written to the output file while the map is being drawn,
+    # so the whole SVG element tree is never kept in memory.  The file is
+    # written under a temporary name and is renamed only when drawing is
+    # finished, so failed drawing doesn't leave a broken SVG.
     logging.info(f"Writing output SVG to {arguments.output_file_name}...")
-    with open(arguments.output_file_name, "w", encoding="utf-8") as output_file:
-        svg.write(output_file)
+    output_path: Path = Path(arguments.output_file_name)
+    temporary_path: Path = output_path.with_name(output_path.name + ".part")
+    try:
+        with temporary_path.open("w", encoding="utf-8") as output_file:
+            svg: StreamingSVGWriter = StreamingSVGWriter(output_file, size)
+            map_: Map = Map(
+                flinger=flinger, svg=svg, configuration=configuration
+            )
+            map_.draw(constructor)
+            svg.close()
+    except BaseException:
+        temporary_path.unlink(missing_ok=True)
+        raise
+    temporary_path.replace(output_path)
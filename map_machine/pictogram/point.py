@@ -1,12 +1,13 @@
 """Point: node representation on the map."""
-import logging
 from typing import Optional
 
 import numpy as np
 import svgwrite
 from colour import Color
+from svgwrite.shapes import Rect
 
 from map_machine.drawing import draw_text
+from map_machine.geometry.quadtree import PRQuadtree
 from map_machine.map_configuration import LabelMode
 from map_machine.osm.osm_reader import Tagged
 from map_machine.pictogram.icon import Icon, IconSet
@@ -20,34 +21,62 @@ class Occupied:
     """
     Structure that remembers places of the canvas occupied by elements (icons,
     texts, shapes).
+
+    Occupied places are stored as boxes of pixels in the quadtree, so memory
+    and time depend on the number of drawn elements instead of canvas area.
     """
 
     def __init__(self, width: int, height: int, overlap: int) -> None:
-        self.matrix = np.full((int(width), int(height)), False, dtype=bool)
-        try:
-            self.matrix = np.full((int(width), int(height)), False, dtype=bool)
-        except Exception:
-            logging.fatal(
-                "Failed to allocate a matrix required by overlap algorithm. "
-                "Try to use smallest area or try --overlap=0 options."
-            )
-            exit(1)
-
         self.width: float = width
         self.height: float = height
         self.overlap: int = overlap
 
+        self.tree: PRQuadtree = PRQuadtree((0.0, 0.0, width, height))
+
     def check(self, point: np.ndarray) -> bool:
         """Check whether point is already occupied by other elements."""
-        if 0.0 <= point[0] < self.width and 0.0 <= point[1] < self.height:
-            return self.matrix[point[0], point[1]]
-        return True
+        return self.check_box(point, point)
+
+    def check_box(self, start: np.ndarray, end: np.ndarray) -> bool:
+        """
+        Check whether any point of the box is out of the canvas or is already
+        occupied by other elements.
+
+        :param start: minimal x and y pixel coordinates of the box
+        :param end: maximal x and y pixel coordinates of the box (inclusive)
+        """
+        if start[0] > end[0] or start[1] > end[1]:
+            return False
+        if not (
+            0.0 <= start[0]
+            and end[0] < self.width
+            and 0.0 <= start[1]
+            and end[1] < self.height
+        ):
+            return True
+        return self.tree.has_intersection((start[0], start[1], end[0], end[1]))
 
     def register(self, point: np.ndarray) -> None:
         """Register that point is occupied by an element."""
-        if 0.0 <= point[0] < self.width and 0.0 <= point[1] < self.height:
-            self.matrix[point[0], point[1]] = True
-            assert self.matrix[point[0], point[1]]
+        self.register_box(point, point)
+
+    def register_box(self, start: np.ndarray, end: np.ndarray) -> None:
+        """
+        Register that all points of the box are occupied by an element.
+
+        :param start: minimal x and y pixel coordinates of the box
+        :param end: maximal x and y pixel coordinates of the box (inclusive)
+        """
+        if start[0] > end[0] or start[1] > end[1]:
+            return
+        if (
+            end[0] < 0.0
+            or start[0] >= self.width
+            or end[1] < 0.0
+            or start[1] >= self.height
+        ):
+            return
+        self.tree.insert((start[0], start[1], end[0], end[1]))
 
 
 class Point(Tagged):
@@ -171,11 +200,7 @@ class Point(Tagged):
 
         if occupied and is_painted:
             overlap: int = occupied.overlap
-            for i in range(-overlap, overlap):
-                for j in range(-overlap, overlap):
-                    occupied.register(
-                        np.array((position[0] + i, position[1] + j))
-                    )
+            occupied.register_box(position - overlap, position + overlap - 1)
 
         return is_painted
 
@@ -237,25 +262,24 @@ class Point(Tagged):
         length: int = len(text) * 6  # FIXME
 
         if occupied:
-            is_occupied: bool = False
-            for i in range(-int(length / 2.0), int(length / 2.0)):
-                text_position: np.ndarray = np.array(
-                    (int(point[0] + i), int(point[1] - 4.0))
-                )
-                if occupied.check(text_position):
-                    is_occupied = True
-                    break
-
-            if is_occupied:
+            half_length: int = int(length / 2.0)
+            start_x: int = int(point[0] - half_length)
+            end_x: int = int(point[0] + (half_length - 1))
+
+            if occupied.check_box(
+                np.array((start_x, int(point[1] - 4.0))),
+                np.array((end_x, int(point[1] - 4.0))),
+            ):
                 return
 
-            for i in range(-int(length / 2.0), int(length / 2.0)):
-                for j in range(-12, 5):
-                    occupied.register(
-                        np.array((int(point[0] + i), int(point[1] + j)))
-                    )
-                    if is_debug:
-                        svg.add(svg.rect((point[0] + i, point[1] + j), (1, 1)))
+            occupied.register_box(
+                np.array((start_x, int(point[1] - 12))),
+                np.array((end_x, int(point[1] + 4))),
+            )
+            if is_debug:
+                for i in range(-half_length, half_length):
+                    for j in range(-12, 5):
+                        svg.add(Rect((point[0] + i, point[1] + j), (1, 1)))
 
         if out_fill_2:
             draw_text(
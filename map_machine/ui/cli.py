@@ -214,6 +214,14 @@ def add_map_arguments(parser: argparse.ArgumentParser) -> None:
         action=argparse.BooleanOptionalAction,
         default=False,
     )
+    parser.add_argument(
+        "--processes",
+        dest="processes",
+        default=1,
+        type=int,
+        help="number of processes to construct paths of big maps",
+        metavar="<integer>",
+    )
 
 
 def add_tile_arguments(parser: argparse.ArgumentParser) -> None:
@@ -11,14 +11,22 @@ from xml.etree.ElementTree import Element
 
 from map_machine.ui.cli import COMMAND_LINES, parse_arguments
 
-LOG: bytes = (
+CONSTRUCTION_LOG: bytes = (
     b"INFO Constructing ways...\n"
     b"INFO Constructing nodes...\n"
+)
+DRAWING_LOG: bytes = (
     b"INFO Drawing ways...\n"
     b"INFO Drawing main icons...\n"
     b"INFO Drawing extra icons...\n"
     b"INFO Drawing texts...\n"
 )
+LOG: bytes = CONSTRUCTION_LOG + DRAWING_LOG
+RENDER_LOG: bytes = (
+    CONSTRUCTION_LOG
+    + b"INFO Writing output SVG to out/map.svg...\n"
+    + DRAWING_LOG
+)
 OUTPUT_PATH: Path = Path("out")
 
 
@@ -51,15 +59,16 @@ def test_render() -> None:
     """Test `render` command."""
     run(
         COMMAND_LINES["render"] + ["--cache", "tests/data"],
-        LOG + b"INFO Writing output SVG to out/map.svg...\n",
+        RENDER_LOG,
     )
     with (OUTPUT_PATH / "map.svg").open(encoding="utf-8") as output_file:
         root: Element = ElementTree.parse(output_file).getroot()
 
-    # 8 expected elements: `defs`, `rect` (background), `g` (outline),
-    # `g` (icon), 4 `text` elements (credits).
-    assert len(root) == 8
-    assert len(root[3][0]) == 0
+    # 7 expected elements: `defs`, `rect` (background), `g` (main icons with
+    # outline and icon), 4 `text` elements (credits).
+    assert len(root) == 7
+    assert root[2].get("id") == "main-icons"
+    assert len(root[2][1][0]) == 0
     assert root.get("width") == "186.0"
     assert root.get("height") == "198.0"
 
@@ -68,16 +77,17 @@ def test_render_with_tooltips() -> None:
     """Test `render` command."""
     run(
         COMMAND_LINES["render_with_tooltips"] + ["--cache", "tests/data"],
-        LOG + b"INFO Writing output SVG to out/map.svg...\n",
+        RENDER_LOG,
     )
     with (OUTPUT_PATH / "map.svg").open(encoding="utf-8") as output_file:
         root: Element = ElementTree.parse(output_file).getroot()
 
-    # 8 expected elements: `defs`, `rect` (background), `g` (outline),
-    # `g` (icon), 4 `text` elements (credits).
-    assert len(root) == 8
-    assert len(root[3][0]) == 1
-    assert root[3][0][0].text == "natural: tree"
+    # 7 expected elements: `defs`, `rect` (background), `g` (main icons with
+    # outline and icon), 4 `text` elements (credits).
+    assert len(root) == 7
+    assert root[2].get("id") == "main-icons"
+    assert len(root[2][1][0]) == 1
+    assert root[2][1][0][0].text == "natural: tree"
     assert root.get("width") == "186.0"
     assert root.get("height") == "198.0"
 
@@ -0,0 +1,72 @@
+"""Test drawing utility."""
+from io import StringIO
+from typing import Union
+
+import numpy as np
+import pytest
+import svgwrite
+from svgwrite.container import Group
+from svgwrite.path import Path as SVGPath
+from svgwrite.shapes import Rect
+
+from map_machine.drawing import StreamingSVGWriter
+
+__author__ = "Sergey Vartanov"
+__email__ = "me@enzet.ru"
+
+
+def test_streaming_writer() -> None:
+    """Test that streaming writer produces the same SVG as `svgwrite`."""
+    size: np.ndarray = np.array((100.0, 50.0))
+    style: dict[str, Union[float, str]] = {
+        "fill": "none",
+        "stroke": "#000000",
+        "stroke_width": 2.0,
+    }
+
+    drawing: svgwrite.Drawing = svgwrite.Drawing(size=size)
+    drawing.add(Rect((0.0, 0.0), size, fill="#FFFFFF"))
+    path: SVGPath = SVGPath(d="M 0,0 L 10,10")
+    path.update(style)
+    drawing.add(path)
+    expected: StringIO = StringIO()
+    drawing.write(expected)
+
+    output: StringIO = StringIO()
+    writer: StreamingSVGWriter = StreamingSVGWriter(output, size)
+    writer.add(Rect((0.0, 0.0), size, fill="#FFFFFF"))
+    writer.write_path("M 0,0 L 10,10", style)
+    writer.close()
+
+    assert output.getvalue() == expected.getvalue()
+
+
+def test_streaming_writer_groups() -> None:
+    """Test that streaming writer writes elements inside groups."""
+    size: np.ndarray = np.array((100.0, 50.0))
+
+    drawing: svgwrite.Drawing = svgwrite.Drawing(size=size)
+    group: Group = Group(id="rectangles")
+    group.add(Rect((0.0, 0.0), size, fill="#FFFFFF"))
+    drawing.add(group)
+    expected: StringIO = StringIO()
+    drawing.write(expected)
+
+    output: StringIO = StringIO()
+    writer: StreamingSVGWriter = StreamingSVGWriter(output, size)
+    writer.open_group(Group(id="empty"))
+    writer.open_group(Group(id="rectangles"))
+    writer.add(Rect((0.0, 0.0), size, fill="#FFFFFF"))
+    writer.close_group()
+    writer.close()
+
+    assert output.getvalue() == expected.getvalue()
+
+
+def test_streaming_writer_write() -> None:
+    """Test that streaming writer cannot be written into another file."""
+    writer: StreamingSVGWriter = StreamingSVGWriter(
+        StringIO(), np.array((100.0, 50.0))
+    )
+    with pytest.raises(NotImplementedError):
+        writer.write(StringIO())
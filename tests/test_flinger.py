@@ -1,7 +1,9 @@
 """Test coordinates computation."""
 import numpy as np
 
+from map_machine.geometry.boundary_box import BoundaryBox
 from map_machine.geometry.flinger import (
+    MercatorFlinger,
     osm_zoom_level_to_pixels_per_meter,
     pseudo_mercator,
 )
@@ -24,3 +26,18 @@ def test_osm_zoom_level_to_pixels_per_meter() -> None:
     assert np.allclose(
         osm_zoom_level_to_pixels_per_meter(18, 40_075_017.0), 1.6745810488364858
     )
+
+
+def test_fling_batch() -> None:
+    """Test that batch projection matches projection of separate points."""
+    flinger: MercatorFlinger = MercatorFlinger(
+        BoundaryBox(10.0, 20.0, 10.01, 20.01), 18, 40_075_017.0
+    )
+    coordinates: np.ndarray = np.array(
+        ((20.0, 10.0), (20.005, 10.002), (20.01, 10.01))
+    )
+    points: np.ndarray = flinger.fling_batch(coordinates)
+
+    assert points.shape == (3, 2)
+    for index, coordinate in enumerate(coordinates):
+        assert np.allclose(points[index], flinger.fling(coordinate))
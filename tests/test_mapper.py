@@ -0,0 +1,197 @@
+"""Test map drawing."""
+import logging
+from io import StringIO
+from pathlib import Path
+from xml.etree import ElementTree
+from xml.etree.ElementTree import Element
+
+import numpy as np
+import pytest
+import svgwrite
+
+from map_machine import mapper
+from map_machine.constructor import Constructor
+from map_machine.drawing import StreamingSVGWriter
+from map_machine.figure import StyledFigure
+from map_machine.geometry.boundary_box import BoundaryBox
+from map_machine.geometry.flinger import MercatorFlinger
+from map_machine.map_configuration import MapConfiguration
+from map_machine.mapper import Map
+from map_machine.osm.osm_reader import OSMData, OSMNode, OSMWay, Tags
+from tests import SCHEME, SHAPE_EXTRACTOR
+
+__author__ = "Sergey Vartanov"
+__email__ = "me@enzet.ru"
+
+
+def add_way(osm_data: OSMData, tags: Tags, coordinates: list[tuple]) -> None:
+    """Add OSM way, nodes with the same coordinates are shared by ways."""
+    nodes: list[OSMNode] = []
+    for latitude, longitude in coordinates:
+        for node in osm_data.nodes.values():
+            if np.array_equal(node.coordinates, (latitude, longitude)):
+                break
+        else:
+            node = OSMNode(
+                {}, len(osm_data.nodes) + 1, np.array((latitude, longitude))
+            )
+            osm_data.add_node(node)
+        nodes.append(node)
+    osm_data.add_way(OSMWay(tags, len(osm_data.ways) + 1, nodes))
+
+
+def get_constructor(configuration: MapConfiguration) -> Constructor:
+    """
+    Construct map with a wood, connected roads, and several points for bounds
+    (-0.001, -0.001, 0.001, 0.001) and zoom level 18.
+    """
+    osm_data: OSMData = OSMData()
+    add_way(
+        osm_data,
+        {"natural": "wood"},
+        [(-0.0008, -0.0008), (-0.0008, 0.0), (0.0, 0.0), (-0.0008, -0.0008)],
+    )
+    add_way(
+        osm_data,
+        {"highway": "primary", "name": "Main Street"},
+        [(-0.0009, -0.0009), (-0.0001, -0.0001), (0.0, 0.0)],
+    )
+    add_way(
+        osm_data,
+        {"highway": "residential"},
+        [(0.0, 0.0), (0.0001, 0.0001), (0.0009, 0.0009)],
+    )
+    for index in range(-4, 5):
+        osm_data.add_node(
+            OSMNode(
+                {"amenity": "cafe", "name": f"Cafe {index}"},
+                100 + index,
+                np.array((index * 0.0002, 0.0003)),
+            )
+        )
+
+    flinger: MercatorFlinger = MercatorFlinger(
+        BoundaryBox(-0.001, -0.001, 0.001, 0.001), 18, osm_data.equator_length
+    )
+    constructor: Constructor = Constructor(
+        osm_data, flinger, SHAPE_EXTRACTOR, configuration
+    )
+    constructor.construct()
+    return constructor
+
+
+def draw_streaming(configuration: MapConfiguration) -> str:
+    """Draw map with streaming SVG writer."""
+    constructor: Constructor = get_constructor(configuration)
+    output: StringIO = StringIO()
+    svg: StreamingSVGWriter = StreamingSVGWriter(
+        output, constructor.flinger.size
+    )
+    Map(constructor.flinger, svg, configuration).draw(constructor)
+    svg.close()
+    return output.getvalue()
+
+
+def draw(configuration: MapConfiguration) -> str:
+    """Draw map with `svgwrite` drawing."""
+    constructor: Constructor = get_constructor(configuration)
+    svg: svgwrite.Drawing = svgwrite.Drawing(size=constructor.flinger.size)
+    Map(constructor.flinger, svg, configuration).draw(constructor)
+    output: StringIO = StringIO()
+    svg.write(output)
+    return output.getvalue()
+
+
+def test_streaming_without_overlap(caplog: pytest.LogCaptureFixture) -> None:
+    """
+    Test that streaming writer draws points in three passes without overlap
+    checking and produces the same SVG as one pass into groups.
+    """
+    configuration: MapConfiguration = MapConfiguration(SCHEME, overlap=0)
+    with caplog.at_level(logging.INFO):
+        output: str = draw_streaming(configuration)
+
+    assert "Drawing main icons..." in caplog.messages
+    assert output == draw(configuration)
+    assert '<g id="main-icons">' in output
+    assert '<g id="texts">' in output
+
+
+def test_figure_paths_in_processes(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that path commands constructed in worker processes are the same."""
+    monkeypatch.setattr(mapper, "PARALLEL_FIGURES_MINIMUM", 0)
+    configuration: MapConfiguration = MapConfiguration(SCHEME, processes=2)
+    constructor: Constructor = get_constructor(configuration)
+    figures: list[StyledFigure] = constructor.get_sorted_figures()
+    map_: Map = Map(constructor.flinger, svgwrite.Drawing(), configuration)
+
+    paths: list[str] = map_.get_figure_paths(figures)
+
+    assert paths
+    assert paths == [figure.get_path(constructor.flinger) for figure in figures]
+
+
+def get_labels(root: Element) -> set[tuple[str, str, str]]:
+    """Get text, x, and y of cafe labels in SVG."""
+    return {
+        (element.text, element.get("x"), element.get("y"))
+        for element in root.iter("{http://www.w3.org/2000/svg}text")
+        if element.text.startswith("Cafe")
+    }
+
+
+def test_draw_tiled(tmp_path: Path) -> None:
+    """
+    Test that map is drawn into tiles with their view boxes, credits, and the
+    same labels as the whole map, and that drawing tiles doesn't change roads
+    and points of the whole map.
+    """
+    configuration: MapConfiguration = MapConfiguration(SCHEME)
+    labels: set[tuple[str, str, str]] = get_labels(
+        ElementTree.fromstring(draw(configuration))
+    )
+    constructor: Constructor = get_constructor(configuration)
+    road_points: list[np.ndarray] = [
+        np.array(road.line.points) for road in constructor.roads.roads
+    ]
+    map_: Map = Map(constructor.flinger, svgwrite.Drawing(), configuration)
+
+    paths: list[Path] = map_.draw_tiled(
+        constructor, tmp_path / "map.svg", (2, 2), 64.0
+    )
+
+    width, height = constructor.flinger.size / 2.0
+    assert [path.name for path in paths] == [
+        "map_0_0.svg",
+        "map_0_1.svg",
+        "map_1_0.svg",
+        "map_1_1.svg",
+    ]
+    tile_labels: set[tuple[str, str, str]] = set()
+    for path, (x, y) in zip(paths, [(0, 0), (0, 1), (1, 0), (1, 1)]):
+        with path.open(encoding="utf-8") as input_file:
+            root: Element = ElementTree.parse(input_file).getroot()
+        assert root.get("viewBox") == (
+            f"{x * width} {y * height} {width} {height}"
+        )
+        assert root.findall(".//{http://www.w3.org/2000/svg}path")
+        tile_labels |= get_labels(root)
+
+        credits_: list[Element] = [
+            element
+            for element in root.findall("{http://www.w3.org/2000/svg}text")
+            if element.text.startswith("Rendering")
+        ]
+        assert credits_
+        for element in credits_:
+            assert x * width < float(element.get("x")) < (x + 1) * width
+            assert y * height < float(element.get("y")) < (y + 1) * height
+
+    assert labels
+    assert tile_labels == labels
+
+    for road, points in zip(constructor.roads.roads, road_points):
+        assert np.array_equal(np.array(road.line.points), points)
+    for point in constructor.points:
+        assert point.y == 0.0
+        assert not point.main_icon_painted
@@ -0,0 +1,47 @@
+"""Test quadtree and occupied canvas structure."""
+import numpy as np
+
+from map_machine.geometry.quadtree import PRQuadtree
+from map_machine.pictogram.point import Occupied
+
+__author__ = "Sergey Vartanov"
+__email__ = "me@enzet.ru"
+
+
+def test_quadtree_query() -> None:
+    """Test that query returns exactly intersecting boxes."""
+    tree: PRQuadtree = PRQuadtree((0.0, 0.0, 100.0, 100.0), capacity=2)
+    for index in range(10):
+        tree.insert((index * 10.0, 0.0, index * 10.0 + 5.0, 5.0), index)
+    tree.insert((40.0, 40.0, 60.0, 60.0), "center")
+
+    assert sorted(tree.query((12.0, 2.0, 31.0, 3.0))) == [1, 2, 3]
+    assert list(tree.query((50.0, 50.0, 50.0, 50.0))) == ["center"]
+    assert tree.has_intersection((5.0, 5.0, 6.0, 6.0))
+    assert not tree.has_intersection((6.0, 6.0, 7.0, 7.0))
+
+
+def test_quadtree_outside_bounds() -> None:
+    """Test boxes that are not fully inside the tree region."""
+    tree: PRQuadtree = PRQuadtree((0.0, 0.0, 100.0, 100.0), capacity=1)
+    tree.insert((-10.0, -10.0, -5.0, -5.0), "outside")
+    tree.insert((1.0, 1.0, 2.0, 2.0), "inside")
+
+    assert list(tree.query((-8.0, -8.0, -8.0, -8.0))) == ["outside"]
+
+
+def test_occupied() -> None:
+    """Test registering and checking occupied boxes."""
+    occupied: Occupied = Occupied(100, 50, 12)
+    occupied.register_box(np.array((10, 10)), np.array((19, 14)))
+
+    assert occupied.check(np.array((10, 10)))
+    assert occupied.check(np.array((19, 14)))
+    assert not occupied.check(np.array((20, 14)))
+    assert occupied.check_box(np.array((0, 12)), np.array((10, 12)))
+    assert not occupied.check_box(np.array((0, 15)), np.array((99, 49)))
+
+    # Points outside the canvas are always occupied.
+    assert occupied.check(np.array((-1, 0)))
+    assert occupied.check(np.array((100, 0)))
+    assert occupied.check_box(np.array((90, 40)), np.array((100, 40)))
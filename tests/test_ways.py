@@ -60,6 +60,21 @@ def test_river_and_wood() -> None:
     assert figures[1].tags["waterway"] == "river"
 
 
+def test_layer_before_priority() -> None:
+    """Check that figures are sorted by layer first and then by priority."""
+    osm_data: OSMData = OSMData()
+    create_way(osm_data, {"waterway": "river", "layer": "-1"}, 1)
+    create_way(osm_data, {"natural": "wood", "layer": "1"}, 2)
+    create_way(osm_data, {"natural": "wood"}, 3)
+
+    figures: list[Figure] = get_constructor(osm_data).get_sorted_figures()
+
+    assert len(figures) == 3
+    assert figures[0].tags["waterway"] == "river"
+    assert "layer" not in figures[1].tags
+    assert figures[2].tags["layer"] == "1"
+
+
 def test_placement_and_lanes() -> None:
     """
     Check that `placement` tag is processed correctly when `lanes` tag is not
@@ -80,3 +95,27 @@ def test_empty_ways() -> None:
     osm_data.add_way(OSMWay({"waterway": "river"}, 2))
 
     assert not get_constructor(osm_data).get_sorted_figures()
+
+
+def test_constructor_part() -> None:
+    """Check that constructor part contains only intersecting figures."""
+    osm_data: OSMData = OSMData()
+    for index, (start, end) in enumerate(
+        [(-0.009, -0.008), (0.008, 0.009)], start=1
+    ):
+        nodes: list[OSMNode] = [
+            OSMNode({}, index * 10, np.array((start, start))),
+            OSMNode({}, index * 10 + 1, np.array((end, end))),
+        ]
+        for node in nodes:
+            osm_data.add_node(node)
+        osm_data.add_way(OSMWay({"natural": "wood"}, index, nodes))
+
+    constructor: Constructor = get_constructor(osm_data)
+    width, height = constructor.flinger.size
+    left: Constructor = constructor.get_part((0.0, 0.0, width / 2.0, height))
+    right: Constructor = constructor.get_part((width / 2.0, 0.0, width, height))
+
+    assert len(constructor.figures) == 2
+    assert left.figures == [constructor.figures[0]]
+    assert right.figures == [constructor.figures[1]]